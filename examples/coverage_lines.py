@@ -0,0 +1,33 @@
+"""Used to check which lines are reported as executed by coverage"""
+
+
+class Counter:
+    start = 0
+
+    def __init__(self):
+        self.count = self.start
+
+
+def numbers(limit):
+    for number in range(limit):
+        yield number
+
+
+def outer(value):
+    def inner():
+        return value * 2
+
+    return inner()
+
+
+def sign(value):
+    if value < 0:
+        return "negative"
+    return "positive"
+
+
+def test_coverage():
+    assert Counter().count == 0
+    assert list(numbers(3)) == [0, 1, 2]
+    assert outer(2) == 4
+    assert sign(1) == "positive"
@@ -1,22 +1,34 @@
 """Each test takes about 6s to run, so can check it is run in parallel"""
 
+import os
 import unittest
 
+N = int(os.environ.get("XC_FIB_N", "18000000"))
+"""Size of the workload, lower it (e.g. `XC_FIB_N=1000000`) for a quicker run"""
+
 
 def fibonacci(n):
-    if n <= 2:
-        return 1
-    else:
-        return fibonacci(n - 1) + fibonacci(n - 2)
+    """
+    Uses the fast doubling identities, F(2k) = F(k)(2F(k+1) - F(k)) and
+    F(2k+1) = F(k)^2 + F(k+1)^2. The time is spent multiplying large integers,
+    which holds the GIL, rather than on millions of Python function calls.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+
+    return a
 
 
 def test_one():
-    fibonacci(40)
+    fibonacci(N)
 
 
 def test_two():
-    fibonacci(40)
+    fibonacci(N)
 
 
 def test_three():
-    fibonacci(40)
+    fibonacci(N)
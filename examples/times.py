@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
 def parse_time(time: str) -> int:
     """Parse an elapsed time string into seconds"""
     splitTime = time.split(":")
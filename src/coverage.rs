@@ -11,12 +11,20 @@ use std::{fs, path};
 use crate::python::{self, PyObject};
 
 /// Enables line coverage collection, and returns the tracer object
-pub fn enable_collection() -> PyObject {
+///
+/// If `reachable` is set, all the lines in a function are counted once it is called
+pub fn enable_collection(reachable: bool) -> PyObject {
   let raw_source = include_str!("./monitoring.py");
   let source = CString::new(raw_source).unwrap();
   let module = python::execute_string(&source).expect("code to run");
+  let tracer = module.get_attr_cstr(c"tracer").expect("var to exist");
+
+  if reachable {
+    let enable_reachable_mode = tracer.get_attr_cstr(c"enable_reachable_mode").unwrap();
+    enable_reachable_mode.call().expect("method to succeed");
+  }
 
-  module.get_attr_cstr(c"tracer").expect("var to exist")
+  tracer
 }
 
 /// Get the lines that have been executed, converting them from a Python structure
@@ -65,6 +65,19 @@ struct CoverageArgs {
     help_heading = "Coverage"
   )]
   pub exclude: Vec<std::path::PathBuf>,
+
+  /// Count every line of a function as covered once it has been called
+  ///
+  /// Faster, as only one event is needed per function, but branches which
+  /// weren't run will be reported as covered.
+  #[clap(
+    name = "coverage-reachable",
+    long = "coverage-reachable",
+    default_value_t = false,
+    requires = "enabled",
+    help_heading = "Coverage"
+  )]
+  pub reachable: bool,
 }
 
 #[derive(Copy, Clone, Default, Debug, clap::ValueEnum)]
@@ -96,7 +109,7 @@ fn main() -> ExitCode {
       let mut subinterpreter = python::SubInterpreter::new();
 
       if args.coverage.enabled {
-        subinterpreter.enable_coverage();
+        subinterpreter.enable_coverage(args.coverage.reachable);
       }
 
       let outcome = subinterpreter.run(|| run::test(test));
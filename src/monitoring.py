@@ -7,32 +7,74 @@ This is used to exclude the standard library from coverage. The `os` module is t
 only module which has the `__file__` attribute.
 """
 
+DISABLE = sys.monitoring.DISABLE
+"""Returned from the callback to stop events from that location"""
+
 
 class Tracer:
     """Object that is used to store the tracing state"""
 
+    __slots__ = (
+        "code_lines",
+        "file_decisions",
+        "reachable",
+        "lines",
+    )
+
     def __init__(self):
-        self.trace = set()
-        self.dont_trace = set()
+        self.code_lines = dict()
+        """
+        Maps `id(code_object)` to the same set of lines stored in `self.lines` for
+        its file. Only code objects which are traced have an entry.
+        """
+        self.file_decisions = dict()
+        """Caches the result of `should_trace_file` for each filename"""
         self.lines = dict()
+        self.reachable = False
+        """
+        Record every line of a code object once it starts, rather than each line as
+        it is executed. Only needs one event per code object.
+        """
 
     @staticmethod
     def should_trace_file(filename):
         return not filename.startswith("<") and not filename.startswith(STDLIB_PATH)
 
-    def line_callback(self, code_object, line_number):
-        if id(code_object) in self.trace:
-            self.lines[code_object.co_filename].add(line_number)
-            return sys.monitoring.DISABLE
+    def start_callback(self, code_object, instruction_offset):
+        """
+        Called the first time a code object starts, enables line events for it if
+        it should be traced. So code outside of the user's files never gets line
+        instrumentation.
+        """
+        filename = code_object.co_filename
+        should_trace = self.file_decisions.get(filename)
+        if should_trace is None:
+            should_trace = Tracer.should_trace_file(filename)
+            self.file_decisions[filename] = should_trace
 
-        if Tracer.should_trace_file(code_object.co_filename):
-            self.trace.add(id(code_object))
-            if code_object.co_filename not in self.lines:
-                self.lines[code_object.co_filename] = set()
+        if not should_trace:
+            return DISABLE
 
-            self.lines[code_object.co_filename].add(line_number)
+        lines = self.lines.setdefault(filename, set())
+        if self.reachable:
+            lines.update(line for _, _, line in code_object.co_lines() if line)
+        else:
+            self.code_lines[id(code_object)] = lines
+            sys.monitoring.set_local_events(
+                sys.monitoring.COVERAGE_ID,
+                code_object,
+                sys.monitoring.events.LINE,
+            )
 
-        return sys.monitoring.DISABLE
+        return DISABLE
+
+    def line_callback(self, code_object, line_number):
+        self.code_lines[id(code_object)].add(line_number)
+        return DISABLE
+
+    def enable_reachable_mode(self):
+        """Count every line of a code object as executed once it has started"""
+        self.reachable = True
 
     def get_lines(self):
         return dict(self.lines)
@@ -40,7 +82,12 @@ class Tracer:
 tracer = Tracer()
 
 sys.monitoring.use_tool_id(sys.monitoring.COVERAGE_ID, "xc")
-sys.monitoring.set_events(sys.monitoring.COVERAGE_ID, sys.monitoring.events.LINE)
+sys.monitoring.set_events(sys.monitoring.COVERAGE_ID, sys.monitoring.events.PY_START)
+sys.monitoring.register_callback(
+    sys.monitoring.COVERAGE_ID,
+    sys.monitoring.events.PY_START,
+    tracer.start_callback,
+)
 sys.monitoring.register_callback(
     sys.monitoring.COVERAGE_ID,
     sys.monitoring.events.LINE,
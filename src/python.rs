@@ -98,10 +98,10 @@ impl SubInterpreter {
     }
   }
 
-  pub fn enable_coverage(&mut self) {
+  pub fn enable_coverage(&mut self, reachable: bool) {
     unsafe { ffi::PyEval_RestoreThread(self.interpreter_state) };
 
-    self.coverage_trace_object = Some(coverage::enable_collection());
+    self.coverage_trace_object = Some(coverage::enable_collection(reachable));
 
     self.interpreter_state = unsafe { ffi::PyEval_SaveThread() };
   }
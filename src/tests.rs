@@ -20,6 +20,32 @@ macro_rules! run_tests {
   }};
 }
 
+macro_rules! run_coverage {
+  ($file:expr $(, $arg:expr)*) => {{
+    let cmd_output = Command::cargo_bin(env!("CARGO_PKG_NAME"))
+      .unwrap()
+      .arg($file)
+      .arg("--output=json")
+      .arg("--coverage")
+      $(.arg($arg))*
+      .output()
+      .unwrap();
+
+    // Find the row for the file in the coverage summary, which is written to stderr
+    // e.g. "├─ ./examples/coverage_lines.py        21         1     95.2%"
+    let stderr = String::from_utf8(cmd_output.stderr).unwrap();
+    let row = stderr
+      .lines()
+      .find(|line| line.contains($file.trim_start_matches("./")))
+      .expect("file to be in coverage summary");
+    let columns = row.split_whitespace().collect::<Vec<_>>();
+
+    let total_lines: usize = columns[2].parse().unwrap();
+    let missed_lines: usize = columns[3].parse().unwrap();
+    (total_lines, missed_lines)
+  }};
+}
+
 #[test]
 fn simple_function() {
   let results = run_tests!("./examples/simple_function.py");
@@ -145,3 +171,33 @@ fn captures_stdout() {
     "hello world\ninto stderr"
   );
 }
+
+#[test]
+fn coverage() {
+  // Covers a class body, a generator, a nested function, and a branch not taken
+  let (total_lines, missed_lines) = run_coverage!("./examples/coverage_lines.py");
+
+  assert_eq!(total_lines, 21);
+  assert_eq!(missed_lines, 1);
+}
+
+#[test]
+fn coverage_reachable() {
+  // The branch not taken is missed normally, but counted once its function is called
+  let (total_lines, missed_lines) = run_coverage!("./examples/coverage_lines.py");
+  assert_eq!((total_lines, missed_lines), (21, 1));
+
+  let (total_lines, missed_lines) =
+    run_coverage!("./examples/coverage_lines.py", "--coverage-reachable");
+  assert_eq!((total_lines, missed_lines), (21, 0));
+}
+
+#[test]
+fn coverage_reachable_requires_coverage() {
+  Command::cargo_bin(env!("CARGO_PKG_NAME"))
+    .unwrap()
+    .arg("./examples/coverage_lines.py")
+    .arg("--coverage-reachable")
+    .assert()
+    .failure();
+}